@@ -3,25 +3,241 @@ Enhanced Movie Database Backend
 Provides improved database operations with proper error handling and validation
 """
 
+import math
 import sqlite3
-from typing import List, Tuple, Optional
+import threading
+from functools import lru_cache
+from typing import Callable, FrozenSet, Iterable, Iterator, List, Tuple, Optional
 import os
 
+
+# Columns returned for a movie record, in display order
+MOVIE_COLUMNS = ('id, movie_id, movie_name, release_date, director, "cast", '
+                 'budget, duration, rating')
+
+# Columns search_movies accepts as keyword arguments
+SEARCH_FIELDS = ("movie_id", "movie_name", "release_date", "director",
+                 "cast", "budget", "duration", "rating")
+
+# Text columns served by the movies_fts full-text index
+FTS_FIELDS = ("movie_id", "movie_name", "director", "cast")
+
+# Fixed result messages returned by the write methods
+_OK_ADD = "Movie added successfully!"
+_OK_UPDATE = "Movie updated successfully!"
+_OK_DELETE = "Movie deleted successfully!"
+_ERR_REQUIRED = "Movie ID and Movie Name are required!"
+
+# Allowed rating range (matches the GUI's validation)
+RATING_MIN, RATING_MAX = 0.0, 5.0
+
+# Rows committed per transaction by add_movies_bulk
+BULK_CHUNK_SIZE = 1000
+
+# Rows pulled per fetchmany() call when streaming the movie list
+FETCH_BATCH_SIZE = 512
+
+# search_movies modes: (SQL condition, parameter pattern, LIKE pattern?) for
+# plain columns. In 'words' mode the FTS_FIELDS are matched through movies_fts
+# instead. ESCAPE still lets SQLite turn a prefix LIKE into an index range scan.
+_LIKE_CONDITION = '"{}" LIKE ? ESCAPE \'\\\''
+SEARCH_MODES = {
+    "words": (_LIKE_CONDITION, "%{}%", True),
+    "prefix": (_LIKE_CONDITION, "{}%", True),
+    "exact": ('"{}" = ? COLLATE NOCASE', "{}", False),
+}
+
+# External-content FTS5 index over movies, kept in sync by triggers,
+# plus NOCASE indexes that let prefix/exact searches use a range scan
+_FTS_SCHEMA = """
+    CREATE VIRTUAL TABLE IF NOT EXISTS movies_fts USING fts5(
+        movie_id, movie_name, director, cast,
+        content='movies', content_rowid='id'
+    );
+    CREATE INDEX IF NOT EXISTS idx_movies_name_nc ON movies (movie_name COLLATE NOCASE);
+    CREATE INDEX IF NOT EXISTS idx_movies_director_nc ON movies (director COLLATE NOCASE);
+    CREATE INDEX IF NOT EXISTS idx_movies_cast_nc ON movies ("cast" COLLATE NOCASE);
+    CREATE TRIGGER IF NOT EXISTS movies_fts_ai AFTER INSERT ON movies BEGIN
+        INSERT INTO movies_fts (rowid, movie_id, movie_name, director, cast)
+        VALUES (new.id, new.movie_id, new.movie_name, new.director, new.cast);
+    END;
+    CREATE TRIGGER IF NOT EXISTS movies_fts_ad AFTER DELETE ON movies BEGIN
+        INSERT INTO movies_fts (movies_fts, rowid, movie_id, movie_name, director, cast)
+        VALUES ('delete', old.id, old.movie_id, old.movie_name, old.director, old.cast);
+    END;
+    CREATE TRIGGER IF NOT EXISTS movies_fts_au AFTER UPDATE ON movies BEGIN
+        INSERT INTO movies_fts (movies_fts, rowid, movie_id, movie_name, director, cast)
+        VALUES ('delete', old.id, old.movie_id, old.movie_name, old.director, old.cast);
+        INSERT INTO movies_fts (rowid, movie_id, movie_name, director, cast)
+        VALUES (new.id, new.movie_id, new.movie_name, new.director, new.cast);
+    END;
+"""
+
+
+def _rating_value(rating: str) -> Optional[float]:
+    """Numeric form of a rating string, stored in rating_num (None if blank/invalid)"""
+    try:
+        value = float(rating)
+    except (TypeError, ValueError):
+        return None
+    # SQLite stores NaN as NULL; inf would poison the running sums
+    return value if math.isfinite(value) else None
+
+
+def _like_literal(value: str) -> str:
+    """Escape LIKE wildcards so user input only matches itself"""
+    return (str(value).replace("\\", "\\\\")
+            .replace("%", "\\%").replace("_", "\\_"))
+
+
+def _fts_match(field: str, value: str) -> str:
+    """Turn user input into an FTS5 prefix query scoped to one column"""
+    terms = " ".join('"' + token.replace('"', '""') + '"*' for token in str(value).split())
+    return f"{field} : ({terms})"
+
+
+@lru_cache(maxsize=1024)
+def _plan_search(fields: FrozenSet[str],
+                 mode: str) -> Tuple[str, Callable[[dict], List[str]]]:
+    """
+    Build (once per field set and mode) the query plan for search_movies
+    Returns: (sql, bind) where bind(values) gives the parameters for sql
+    """
+    ordered = sorted(fields)
+    if mode == "words":
+        fts_fields = [field for field in ordered if field in FTS_FIELDS]
+    else:
+        fts_fields = []
+    plain_fields = [field for field in ordered if field not in fts_fields]
+    condition, pattern, like = SEARCH_MODES[mode]
+    
+    conditions = []
+    if fts_fields:
+        conditions.append("id IN (SELECT rowid FROM movies_fts WHERE movies_fts MATCH ?)")
+    conditions.extend(condition.format(field) for field in plain_fields)
+    sql = f"SELECT {MOVIE_COLUMNS} FROM movies WHERE " + " OR ".join(conditions)
+    
+    def bind(values: dict) -> List[str]:
+        params = []
+        if fts_fields:
+            params.append(" OR ".join(_fts_match(field, values[field])
+                                      for field in fts_fields))
+        params.extend(pattern.format(_like_literal(values[field]) if like else values[field])
+                      for field in plain_fields)
+        return params
+    
+    return sql, bind
+
+
 class MovieDatabase:
     """Database handler for movie management system"""
     
+    # Hot statements kept as constants so sqlite3's statement cache
+    # can reuse the compiled form on every call
+    _SQL_INSERT = """
+        INSERT INTO movies (movie_id, movie_name, release_date,
+                            director, cast, budget, duration, rating, rating_num)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    _SQL_INSERT_IGNORE = _SQL_INSERT.replace("INSERT INTO", "INSERT OR IGNORE INTO")
+    _SQL_UPDATE = """
+        UPDATE movies
+        SET movie_id=?, movie_name=?, release_date=?, director=?,
+            cast=?, budget=?, duration=?, rating=?, rating_num=?
+        WHERE id=?
+    """
+    _SQL_DELETE = "DELETE FROM movies WHERE id=?"
+    # Single-row writes hand back the stored record in the same statement
+    # where SQLite supports RETURNING (3.35+); older versions read it back
+    _HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+    _SQL_INSERT_RETURNING = _SQL_INSERT + f"RETURNING {MOVIE_COLUMNS}"
+    _SQL_UPDATE_RETURNING = _SQL_UPDATE + f"RETURNING {MOVIE_COLUMNS}"
+    _SQL_DELETE_RETURNING = _SQL_DELETE + " RETURNING rating_num"
+    _SQL_SELECT_ALL = f"SELECT {MOVIE_COLUMNS} FROM movies ORDER BY id DESC"
+    _SQL_SELECT_ALL_NUMERIC = f"SELECT {MOVIE_COLUMNS}, rating_num FROM movies ORDER BY id DESC"
+    _SQL_SELECT_BY_ID = f"SELECT {MOVIE_COLUMNS} FROM movies WHERE id=?"
+    _SQL_SELECT_RATING = "SELECT rating_num FROM movies WHERE id=?"
+    # Seeds the statistics counters in one round-trip: the outer aggregate
+    # is a covering scan of idx_movies_rating_num, COUNT(*) its own fast path
+    _SQL_STATS = """
+        SELECT (SELECT COUNT(*) FROM movies), TOTAL(rating_num), COUNT(rating_num)
+        FROM movies WHERE rating_num IS NOT NULL
+    """
+    
     def __init__(self, db_name: str = "movie_system.db"):
         self.db_name = db_name
+        # One long-lived connection shared by every operation; the lock
+        # serialises access so it can be used from worker threads too
+        self._lock = threading.RLock()
+        self.con = self.get_connection()
+        # Running counters behind get_statistics; None until first computed
+        self._stats_cache: Optional[dict] = None
         self.initialize_database()
     
     def get_connection(self):
-        """Create and return a database connection"""
-        return sqlite3.connect(self.db_name)
+        """Create and return a configured database connection"""
+        con = sqlite3.connect(self.db_name, check_same_thread=False,
+                              cached_statements=256)
+        # Rows support both index and column-name access
+        con.row_factory = sqlite3.Row
+        self._configure_connection(con)
+        return con
+    
+    @staticmethod
+    def _configure_connection(con):
+        """Apply per-connection performance settings"""
+        # WAL + synchronous=NORMAL avoids an fsync on every commit
+        con.execute("PRAGMA journal_mode=WAL")
+        con.execute("PRAGMA synchronous=NORMAL")
+        con.execute("PRAGMA temp_store=MEMORY")
+        con.execute("PRAGMA mmap_size=134217728")  # 128 MB
+        con.execute("PRAGMA cache_size=-20000")    # ~20 MB page cache
+        con.execute("PRAGMA foreign_keys=ON")
+    
+    def close(self):
+        """Refresh query-planner statistics and close the persistent connection"""
+        with self._lock:
+            try:
+                self.con.execute("PRAGMA optimize")
+            except sqlite3.Error as e:
+                print(f"Optimize error: {e}")
+            self.con.close()
+    
+    def _adjust_stats(self, count_delta: int = 0, old_rating: Optional[float] = None,
+                      new_rating: Optional[float] = None):
+        """Apply one write to the cached statistics (caller holds the lock)"""
+        stats = self._stats_cache
+        if stats is None:
+            return
+        stats['total_movies'] += count_delta
+        if old_rating is not None:
+            stats['rating_sum'] -= old_rating
+            stats['rating_count'] -= 1
+        if new_rating is not None:
+            stats['rating_sum'] += new_rating
+            stats['rating_count'] += 1
+    
+    def _write_returning(self, cur, sql: str, sql_returning: str, params: tuple,
+                         record_id: Optional[int] = None) -> Optional[sqlite3.Row]:
+        """
+        Run a single-row INSERT/UPDATE and return the stored record
+        record_id identifies the row for UPDATE; INSERT uses the new rowid
+        """
+        if self._HAS_RETURNING:
+            cur.execute(sql_returning, params)
+            return cur.fetchone()
+        
+        cur.execute(sql, params)
+        if cur.rowcount == 0:
+            return None
+        cur.execute(self._SQL_SELECT_BY_ID,
+                    (cur.lastrowid if record_id is None else record_id,))
+        return cur.fetchone()
     
     def initialize_database(self):
         """Create the movies table if it doesn't exist"""
         try:
-            with self.get_connection() as con:
+            with self._lock, self.con as con:
                 cur = con.cursor()
                 cur.execute("""
                     CREATE TABLE IF NOT EXISTS movies (
@@ -33,9 +249,31 @@ class MovieDatabase:
                         cast TEXT,
                         budget TEXT,
                         duration TEXT,
-                        rating TEXT
+                        rating TEXT,
+                        rating_num REAL
                     )
                 """)
+                
+                # Older databases only have the text rating; add and backfill
+                # the numeric copy used for statistics
+                cur.execute("PRAGMA table_info(movies)")
+                if "rating_num" not in [column[1] for column in cur.fetchall()]:
+                    cur.execute("ALTER TABLE movies ADD COLUMN rating_num REAL")
+                    cur.execute("SELECT id, rating FROM movies")
+                    cur.executemany("UPDATE movies SET rating_num=? WHERE id=?",
+                                    [(_rating_value(rating), record_id)
+                                     for record_id, rating in cur.fetchall()])
+                cur.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_movies_rating_num
+                    ON movies (rating_num) WHERE rating_num IS NOT NULL
+                """)
+                
+                cur.execute("SELECT 1 FROM sqlite_master WHERE name='movies_fts'")
+                fts_exists = cur.fetchone() is not None
+                cur.executescript(_FTS_SCHEMA)
+                if not fts_exists:
+                    # Index rows that predate the full-text table
+                    cur.execute("INSERT INTO movies_fts (movies_fts) VALUES ('rebuild')")
                 con.commit()
         except sqlite3.Error as e:
             print(f"Database initialization error: {e}")
@@ -48,59 +286,157 @@ class MovieDatabase:
         Add a new movie record to the database
         Returns: (success: bool, message: str)
         """
+        success, message, _ = self.add_movie_returning(
+            movie_id, movie_name, release_date, director, cast, budget, duration, rating)
+        return success, message
+    
+    def add_movie_returning(self, movie_id: str, movie_name: str, release_date: str = "",
+                            director: str = "", cast: str = "", budget: str = "",
+                            duration: str = "", rating: str = ""
+                            ) -> Tuple[bool, str, Optional[sqlite3.Row]]:
+        """
+        Add a new movie record and return it as stored
+        Returns: (success: bool, message: str, record or None on failure)
+        """
         if not movie_id or not movie_name:
-            return False, "Movie ID and Movie Name are required!"
+            return False, _ERR_REQUIRED, None
         
         try:
-            with self.get_connection() as con:
+            with self._lock, self.con as con:
                 cur = con.cursor()
-                cur.execute("""
-                    INSERT INTO movies (movie_id, movie_name, release_date, 
-                                      director, cast, budget, duration, rating)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (movie_id, movie_name, release_date, director, 
-                      cast, budget, duration, rating))
+                rating_num = _rating_value(rating)
+                row = self._write_returning(
+                    cur, self._SQL_INSERT, self._SQL_INSERT_RETURNING,
+                    (movie_id, movie_name, release_date, director,
+                     cast, budget, duration, rating, rating_num))
                 con.commit()
-                return True, "Movie added successfully!"
+                self._adjust_stats(1, new_rating=rating_num)
+                return True, _OK_ADD, row
         except sqlite3.IntegrityError:
-            return False, f"Movie ID '{movie_id}' already exists!"
+            return False, f"Movie ID '{movie_id}' already exists!", None
         except sqlite3.Error as e:
-            return False, f"Database error: {str(e)}"
+            return False, f"Database error: {str(e)}", None
     
-    def view_all_movies(self) -> List[Tuple]:
-        """Retrieve all movie records"""
-        try:
-            with self.get_connection() as con:
+    def add_movies_bulk(self, rows: Iterable[Tuple[str, ...]]) -> Tuple[int, int]:
+        """
+        Add many movie records, committing once per BULK_CHUNK_SIZE rows
+        Each row holds the add_movie fields in order; rows missing an ID or
+        name, with a rating outside RATING_MIN..RATING_MAX, or whose Movie ID
+        already exists, are skipped
+        Returns: (added: int, skipped: int)
+        Raises sqlite3.Error if a chunk fails; earlier chunks stay committed
+        """
+        added = skipped = 0
+        chunk = []
+        
+        def flush():
+            nonlocal added, skipped
+            with self._lock, self.con as con:
                 cur = con.cursor()
-                cur.execute("SELECT * FROM movies ORDER BY id DESC")
-                return cur.fetchall()
+                cur.executemany(self._SQL_INSERT_IGNORE, chunk)
+                added += cur.rowcount
+                skipped += len(chunk) - cur.rowcount
+                # Which rows were ignored is unknown; recount on next use
+                self._stats_cache = None
+            chunk.clear()
+        
+        for row in rows:
+            row = [str(value).strip() for value in row][:8]
+            row += [""] * (8 - len(row))
+            # The rating is parsed once, for both validation and rating_num
+            rating_num = _rating_value(row[7])
+            if (not row[0] or not row[1] or
+                    row[7] and (rating_num is None or
+                                not RATING_MIN <= rating_num <= RATING_MAX)):
+                skipped += 1
+                continue
+            row.append(rating_num)
+            chunk.append(row)
+            if len(chunk) >= BULK_CHUNK_SIZE:
+                flush()
+        if chunk:
+            flush()
+        if added >= BULK_CHUNK_SIZE:
+            # Large imports change table/index sizes enough that the
+            # planner's statistics should be refreshed
+            with self._lock:
+                self.con.execute("ANALYZE movies")
+        return added, skipped
+    
+    def view_all_movies(self) -> Iterator[sqlite3.Row]:
+        """
+        Stream all movie records, newest first
+        Rows are fetched FETCH_BATCH_SIZE at a time as the caller consumes them.
+        The connection lock is held until the stream is exhausted or closed,
+        since a rollback by another write would reset the shared cursor;
+        consume it in one go on the thread that started it (e.g. list())
+        """
+        try:
+            with self._lock:
+                cur = self.con.cursor()
+                cur.arraysize = FETCH_BATCH_SIZE
+                cur.execute(self._SQL_SELECT_ALL)
+                while True:
+                    rows = cur.fetchmany()
+                    if not rows:
+                        break
+                    yield from rows
         except sqlite3.Error as e:
             print(f"Error retrieving movies: {e}")
-            return []
     
-    def search_movies(self, **kwargs) -> List[Tuple]:
+    def view_all_movies_df(self):
+        """
+        Retrieve all movie records as a pandas DataFrame for analytics
+        rating_num comes back as a float64 column (NaN for unrated movies)
+        Requires pandas, which is imported only when this is called
+        """
+        import pandas as pd
+        
+        try:
+            with self._lock:
+                cur = self.con.cursor()
+                cur.row_factory = None  # plain tuples for DataFrame.from_records
+                cur.execute(self._SQL_SELECT_ALL_NUMERIC)
+                columns = [column[0] for column in cur.description]
+                return pd.DataFrame.from_records(cur.fetchall(), columns=columns, index="id")
+        except sqlite3.Error as e:
+            print(f"Error retrieving movies: {e}")
+            return pd.DataFrame()
+    
+    def search_movies(self, mode: str = "words", **kwargs) -> List[sqlite3.Row]:
         """
         Search movies by any field
-        Supports partial matching for better search results
+        mode='words': text fields (see FTS_FIELDS) use the full-text index
+        and match whole words by prefix, so "incep" finds "Inception" but
+        "ception" does not; other fields still match any substring.
+        mode='prefix' / 'exact': every field must start with / equal the
+        value (case-insensitive); name, director and cast use their NOCASE
+        indexes, other fields are scanned.
+        % and _ in the values are matched literally.
         """
+        if mode not in SEARCH_MODES:
+            raise ValueError(f"Unknown search mode: {mode!r}")
+        unknown = set(kwargs) - set(SEARCH_FIELDS)
+        if unknown:
+            # Field names end up in the SQL, so only real columns are allowed
+            raise ValueError(f"Unknown search field(s): {', '.join(sorted(unknown))}")
+        
         try:
-            with self.get_connection() as con:
+            with self._lock, self.con as con:
                 cur = con.cursor()
                 
-                # Build dynamic query
-                conditions = []
-                params = []
+                # Only search non-empty values; a full-text field needs at
+                # least one word, as an empty FTS query is a syntax error
+                fields = frozenset(
+                    key for key, value in kwargs.items()
+                    if value and (mode != "words" or key not in FTS_FIELDS
+                                  or str(value).split())
+                )
+                if not fields:
+                    return list(self.view_all_movies())
                 
-                for key, value in kwargs.items():
-                    if value:  # Only search non-empty values
-                        conditions.append(f"{key} LIKE ?")
-                        params.append(f"%{value}%")
-                
-                if not conditions:
-                    return self.view_all_movies()
-                
-                query = "SELECT * FROM movies WHERE " + " OR ".join(conditions)
-                cur.execute(query, params)
+                query, bind = _plan_search(fields, mode)
+                cur.execute(query, bind(kwargs))
                 return cur.fetchall()
         except sqlite3.Error as e:
             print(f"Search error: {e}")
@@ -110,67 +446,98 @@ class MovieDatabase:
                     release_date: str = "", director: str = "", cast: str = "",
                     budget: str = "", duration: str = "", rating: str = "") -> Tuple[bool, str]:
         """Update an existing movie record"""
+        success, message, _ = self.update_movie_returning(
+            record_id, movie_id, movie_name, release_date, director,
+            cast, budget, duration, rating)
+        return success, message
+    
+    def update_movie_returning(self, record_id: int, movie_id: str, movie_name: str,
+                               release_date: str = "", director: str = "", cast: str = "",
+                               budget: str = "", duration: str = "", rating: str = ""
+                               ) -> Tuple[bool, str, Optional[sqlite3.Row]]:
+        """
+        Update an existing movie record and return it as stored
+        Returns: (success: bool, message: str, record or None on failure)
+        """
         if not movie_id or not movie_name:
-            return False, "Movie ID and Movie Name are required!"
+            return False, _ERR_REQUIRED, None
         
         try:
-            with self.get_connection() as con:
+            with self._lock, self.con as con:
                 cur = con.cursor()
-                cur.execute("""
-                    UPDATE movies 
-                    SET movie_id=?, movie_name=?, release_date=?, director=?,
-                        cast=?, budget=?, duration=?, rating=?
-                    WHERE id=?
-                """, (movie_id, movie_name, release_date, director, 
-                      cast, budget, duration, rating, record_id))
-                con.commit()
+                cur.execute(self._SQL_SELECT_RATING, (record_id,))
+                old = cur.fetchone()
+                if old is None:
+                    return False, "No record found to update!", None
                 
-                if cur.rowcount == 0:
-                    return False, "No record found to update!"
-                return True, "Movie updated successfully!"
+                rating_num = _rating_value(rating)
+                row = self._write_returning(
+                    cur, self._SQL_UPDATE, self._SQL_UPDATE_RETURNING,
+                    (movie_id, movie_name, release_date, director,
+                     cast, budget, duration, rating, rating_num, record_id),
+                    record_id)
+                con.commit()
+                self._adjust_stats(old_rating=old[0], new_rating=rating_num)
+                return True, _OK_UPDATE, row
         except sqlite3.IntegrityError:
-            return False, f"Movie ID '{movie_id}' already exists!"
+            return False, f"Movie ID '{movie_id}' already exists!", None
         except sqlite3.Error as e:
-            return False, f"Update error: {str(e)}"
+            return False, f"Update error: {str(e)}", None
     
     def delete_movie(self, record_id: int) -> Tuple[bool, str]:
         """Delete a movie record by ID"""
         try:
-            with self.get_connection() as con:
+            with self._lock, self.con as con:
                 cur = con.cursor()
-                cur.execute("DELETE FROM movies WHERE id=?", (record_id,))
+                if self._HAS_RETURNING:
+                    cur.execute(self._SQL_DELETE_RETURNING, (record_id,))
+                    deleted = cur.fetchall()
+                else:
+                    cur.execute(self._SQL_SELECT_RATING, (record_id,))
+                    deleted = cur.fetchall()
+                    cur.execute(self._SQL_DELETE, (record_id,))
                 con.commit()
                 
-                if cur.rowcount == 0:
+                if not deleted:
                     return False, "No record found to delete!"
-                return True, "Movie deleted successfully!"
+                self._adjust_stats(-1, old_rating=deleted[0][0])
+                return True, _OK_DELETE
         except sqlite3.Error as e:
             return False, f"Delete error: {str(e)}"
     
-    def get_movie_by_id(self, record_id: int) -> Optional[Tuple]:
+    def get_movie_by_id(self, record_id: int) -> Optional[sqlite3.Row]:
         """Retrieve a single movie by database ID"""
         try:
-            with self.get_connection() as con:
+            with self._lock, self.con as con:
                 cur = con.cursor()
-                cur.execute("SELECT * FROM movies WHERE id=?", (record_id,))
+                cur.execute(self._SQL_SELECT_BY_ID, (record_id,))
                 return cur.fetchone()
         except sqlite3.Error as e:
             print(f"Error retrieving movie: {e}")
             return None
     
     def get_statistics(self) -> dict:
-        """Get database statistics"""
+        """
+        Get database statistics
+        Counted once, then kept current by add/update/delete_movie
+        """
         try:
-            with self.get_connection() as con:
-                cur = con.cursor()
-                cur.execute("SELECT COUNT(*) FROM movies")
-                total_movies = cur.fetchone()[0]
-                
-                cur.execute("SELECT AVG(CAST(rating AS REAL)) FROM movies WHERE rating != ''")
-                avg_rating = cur.fetchone()[0]
+            with self._lock:
+                if self._stats_cache is None:
+                    cur = self.con.cursor()
+                    cur.execute(self._SQL_STATS)
+                    total_movies, rating_sum, rating_count = cur.fetchone()
+                    self._stats_cache = {
+                        'total_movies': total_movies,
+                        'rating_sum': rating_sum,
+                        'rating_count': rating_count
+                    }
+                stats = self._stats_cache
+                avg_rating = (stats['rating_sum'] / stats['rating_count']
+                              if stats['rating_count'] else 0)
                 
                 return {
-                    'total_movies': total_movies,
+                    'total_movies': stats['total_movies'],
                     'average_rating': round(avg_rating, 2) if avg_rating else 0
                 }
         except sqlite3.Error as e:
@@ -191,7 +558,11 @@ def AddMovieRec(*args):
     return db.add_movie(*args)
 
 def ViewMovieData():
-    """View all movies"""
+    """
+    View all movies
+    Streams sqlite3.Row records, not tuples: use tuple(row) to compare
+    with tuples or to pass a row to ttk, and list() if you need a sequence
+    """
     return db.view_all_movies()
 
 def DeleteMovieRec(record_id):
@@ -199,9 +570,15 @@ def DeleteMovieRec(record_id):
     return db.delete_movie(record_id)
 
 def SearchMovieData(movie_id="", movie_name="", release_date="", director="",
-                    cast="", budget="", duration="", rating=""):
-    """Search movies"""
+                    cast="", budget="", duration="", rating="", mode="words"):
+    """
+    Search movies (see MovieDatabase.search_movies for the modes)
+    The default 'words' mode matches ID, name, director and cast by word
+    prefix rather than by any substring
+    Returns sqlite3.Row records, not tuples
+    """
     return db.search_movies(
+        mode=mode,
         movie_id=movie_id,
         movie_name=movie_name,
         release_date=release_date,
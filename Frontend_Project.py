@@ -3,13 +3,18 @@ Enhanced Movie Ticket Booking System - Frontend
 Features: Improved UI, validation, error handling, and user feedback
 """
 
+import csv
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import *
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 import movie_backend as backend
 
 class MovieManagementSystem:
     """Main application class for movie management"""
     
+    # How often the Tk thread checks on background database work (ms)
+    POLL_INTERVAL = 20
+    
     def __init__(self, root):
         self.root = root
         self.root.title("Movie Management System")
@@ -27,9 +32,30 @@ class MovieManagementSystem:
         self.duration = StringVar()
         self.rating = StringVar()
         
+        # Form variables in record column order (after the database ID)
+        self._vars = [self.movie_id, self.movie_name, self.release_date, self.director,
+                      self.cast, self.budget, self.duration, self.rating]
+        
+        # Pending after_idle job that copies the selection into the form
+        self._pending_select = None
+        
         # Track selected record
         self.selected_record = None
         
+        # Database ID -> Treeview item, including rows hidden by a search
+        self._tree_rows = {}
+        # Reused buffer for handing database rows to the Treeview
+        self._row_buf = [None] * 9
+        
+        # Worker threads for slow database reads; only the newest list
+        # load (display all / search) is allowed to update the Treeview
+        self._pool = ThreadPoolExecutor(max_workers=2)
+        self._list_request = 0
+        # (load, show) of the list load still in flight, if any
+        self._pending_list_load = None
+        # True while import_csv's worker is writing to the database
+        self._importing = False
+        
         # Initialize database
         backend.MovieData()
         
@@ -206,6 +232,7 @@ class MovieManagementSystem:
             ("🔍 Search", self.search_movies, "#ffc107"),
             ("📋 Display All", self.refresh_movie_list, "#17a2b8"),
             ("🧹 Clear", self.clear_fields, "#6c757d"),
+            ("📥 Import CSV", self.import_csv, "#6f42c1"),
             ("❌ Exit", self.exit_application, "#343a40")
         ]
         
@@ -259,7 +286,7 @@ class MovieManagementSystem:
         if self.rating.get().strip():
             try:
                 rating_val = float(self.rating.get())
-                if rating_val < 0 or rating_val > 5:
+                if not 0 <= rating_val <= 5:  # also rejects NaN
                     messagebox.showerror("Validation Error", "Rating must be between 0 and 5!")
                     return False
             except ValueError:
@@ -273,7 +300,7 @@ class MovieManagementSystem:
         if not self.validate_fields():
             return
         
-        success, message = backend.db.add_movie(
+        success, message, movie = backend.db.add_movie_returning(
             self.movie_id.get().strip(),
             self.movie_name.get().strip(),
             self.release_date.get().strip(),
@@ -287,8 +314,10 @@ class MovieManagementSystem:
         if success:
             messagebox.showinfo("Success", message)
             self.clear_fields()
-            self.refresh_movie_list()
-            self.update_status("Movie added successfully")
+            if movie:
+                self.insert_movie_row(movie, 0)
+            self.restart_list_load()
+            self.show_statistics()
         else:
             messagebox.showerror("Error", message)
     
@@ -301,7 +330,7 @@ class MovieManagementSystem:
         if not self.validate_fields():
             return
         
-        success, message = backend.db.update_movie(
+        success, message, movie = backend.db.update_movie_returning(
             self.selected_record[0],
             self.movie_id.get().strip(),
             self.movie_name.get().strip(),
@@ -314,10 +343,14 @@ class MovieManagementSystem:
         )
         
         if success:
+            record_id = self.selected_record[0]
             messagebox.showinfo("Success", message)
             self.clear_fields()
-            self.refresh_movie_list()
-            self.update_status("Movie updated successfully")
+            if movie and record_id in self._tree_rows:
+                self._row_buf[:] = movie
+                self.tree.item(self._tree_rows[record_id], values=self._row_buf)
+            self.restart_list_load()
+            self.show_statistics()
         else:
             messagebox.showerror("Error", message)
     
@@ -333,47 +366,159 @@ class MovieManagementSystem:
         )
         
         if response:
-            success, message = backend.db.delete_movie(self.selected_record[0])
+            record_id = self.selected_record[0]
+            success, message = backend.db.delete_movie(record_id)
             if success:
                 messagebox.showinfo("Success", message)
                 self.clear_fields()
-                self.refresh_movie_list()
-                self.update_status("Movie deleted successfully")
+                iid = self._tree_rows.pop(record_id, None)
+                if iid:
+                    self.tree.delete(iid)
+                self.restart_list_load()
+                self.show_statistics()
             else:
                 messagebox.showerror("Error", message)
     
     def search_movies(self):
         """Search movies based on input fields"""
-        results = backend.SearchMovieData(
-            self.movie_id.get().strip(),
-            self.movie_name.get().strip(),
-            self.release_date.get().strip(),
-            self.director.get().strip(),
-            self.cast.get().strip(),
-            self.budget.get().strip(),
-            self.duration.get().strip(),
-            self.rating.get().strip()
+        # Read the form on the Tk thread; the worker only sees plain strings
+        criteria = [var.get().strip() for var in self._vars]
+        self.start_list_load(lambda: backend.SearchMovieData(*criteria),
+                             self.show_search_results)
+    
+    def show_search_results(self, results):
+        """Show search results in the treeview"""
+        self.filter_movies(results)
+        self.update_status(f"Found {len(results)} movie(s)")
+    
+    def import_csv(self):
+        """Import movies from a CSV file in one batched operation"""
+        path = filedialog.askopenfilename(
+            title="Import Movies",
+            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
         )
+        if not path:
+            return
         
-        self.display_movies(results)
-        self.update_status(f"Found {len(results)} movie(s)")
+        def read_and_import():
+            # Runs on a worker thread: parsing a large file must not block Tk
+            with open(path, newline="", encoding="utf-8-sig") as f:
+                rows = list(csv.reader(f))
+            
+            # Skip an optional header row
+            if rows and rows[0] and rows[0][0].strip().lower() in ("movie_id", "movie id"):
+                rows = rows[1:]
+            return backend.db.add_movies_bulk(rows)
+        
+        def imported(result):
+            self._importing = False
+            added, skipped = result
+            self.refresh_movie_list()
+            messagebox.showinfo("Import Complete", f"Imported {added} movie(s), skipped {skipped}.")
+        
+        def failed(error):
+            self._importing = False
+            if isinstance(error, (OSError, UnicodeDecodeError, csv.Error)):
+                messagebox.showerror("Error", f"Could not read file: {error}")
+            else:
+                # Chunks committed before the failure are kept
+                self.refresh_movie_list()
+                messagebox.showerror("Error", f"Import failed: {error}")
+        
+        self._importing = True
+        self.update_status("Importing movies...")
+        self.run_in_background(read_and_import, imported, on_error=failed)
     
     def refresh_movie_list(self):
         """Refresh the movie list display"""
-        movies = backend.ViewMovieData()
+        self.start_list_load(lambda: list(backend.ViewMovieData()), self.show_all_movies)
+    
+    def show_all_movies(self, movies):
+        """Show the full movie list in the treeview"""
         self.display_movies(movies)
+        self.show_statistics()
+    
+    def start_list_load(self, load, show):
+        """Run load() on a worker and show() its rows, superseding older list loads"""
+        self._list_request += 1
+        request = self._list_request
+        self._pending_list_load = (load, show)
+        
+        def deliver(rows):
+            if request == self._list_request:
+                self._pending_list_load = None
+                show(rows)
+        
+        self.run_in_background(load, deliver)
+    
+    def restart_list_load(self):
+        """
+        Re-run a list load still in flight after a write, so its older
+        snapshot cannot undo the write's Treeview edit
+        """
+        if self._pending_list_load:
+            self.start_list_load(*self._pending_list_load)
+    
+    def run_in_background(self, func, callback, *args, on_error=None):
+        """
+        Run func(*args) on a worker thread and pass its result to callback
+        If func raises, on_error(exception) is called instead (default: error dialog)
+        """
+        future = self._pool.submit(func, *args)
+        self.wait_for_result(future, callback, on_error)
+    
+    def wait_for_result(self, future, callback, on_error=None):
+        """Poll a worker future from the Tk thread, since Tk is not thread-safe"""
+        if not future.done():
+            self.root.after(self.POLL_INTERVAL, self.wait_for_result, future, callback, on_error)
+            return
+        
+        try:
+            result = future.result()
+        except Exception as e:
+            if on_error:
+                on_error(e)
+            else:
+                messagebox.showerror("Error", f"Database error: {e}")
+            return
+        callback(result)
+    
+    def show_statistics(self):
+        """Show database statistics in the status bar"""
         stats = backend.db.get_statistics()
         self.update_status(f"Total Movies: {stats['total_movies']} | Avg Rating: {stats['average_rating']}")
     
     def display_movies(self, movies):
         """Display movies in treeview"""
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        # Clear existing items, including ones detached by a search
+        if self._tree_rows:
+            self.tree.delete(*self._tree_rows.values())
+            self._tree_rows.clear()
         
-        # Insert movies
+        # Insert movies (works with lists or streamed rows)
         for movie in movies:
-            self.tree.insert("", END, values=movie)
+            self.insert_movie_row(movie)
+    
+    def insert_movie_row(self, movie, index=END):
+        """Insert one movie into the treeview and track its item"""
+        # Rows are sqlite3.Row objects, which ttk cannot format directly
+        self._row_buf[:] = movie
+        self._tree_rows[movie[0]] = self.tree.insert("", index, values=self._row_buf)
+    
+    def filter_movies(self, movies):
+        """Show only the given movies, reusing existing treeview items"""
+        matched = set()
+        for index, movie in enumerate(movies):
+            matched.add(movie[0])
+            iid = self._tree_rows.get(movie[0])
+            if iid:
+                self.tree.move(iid, "", index)  # reattaches hidden rows
+            else:
+                self.insert_movie_row(movie, index)
+        
+        hidden = [iid for record_id, iid in self._tree_rows.items() if record_id not in matched]
+        if hidden:
+            self.tree.detach(*hidden)
     
     def on_movie_select(self, event):
         """Handle movie selection from treeview"""
@@ -382,36 +527,43 @@ class MovieManagementSystem:
             item = self.tree.item(selection[0])
             self.selected_record = item['values']
             
-            # Populate fields
-            self.movie_id.set(self.selected_record[1])
-            self.movie_name.set(self.selected_record[2])
-            self.release_date.set(self.selected_record[3])
-            self.director.set(self.selected_record[4])
-            self.cast.set(self.selected_record[5])
-            self.budget.set(self.selected_record[6])
-            self.duration.set(self.selected_record[7])
-            self.rating.set(self.selected_record[8])
+            # Populate fields once the event queue is idle, so rapid
+            # arrow-key navigation only fills the form for the last row
+            if self._pending_select is None:
+                self._pending_select = self.root.after_idle(self.populate_fields)
+    
+    def populate_fields(self):
+        """Copy the selected record into the input fields"""
+        self._pending_select = None
+        if self.selected_record:
+            for var, value in zip(self._vars, self.selected_record[1:]):
+                var.set(value)
     
     def clear_fields(self):
         """Clear all input fields"""
-        self.movie_id.set("")
-        self.movie_name.set("")
-        self.release_date.set("")
-        self.director.set("")
-        self.cast.set("")
-        self.budget.set("")
-        self.duration.set("")
-        self.rating.set("")
+        if self._pending_select is not None:
+            self.root.after_cancel(self._pending_select)
+            self._pending_select = None
+        for var in self._vars:
+            var.set("")
         self.selected_record = None
         self.update_status("Fields cleared")
     
     def exit_application(self):
         """Exit the application"""
+        if self._importing:
+            # Closing the database under a running import would lose its rows
+            messagebox.showwarning("Exit Application",
+                                   "An import is still running. Please wait for it to finish.")
+            return
         response = messagebox.askyesno(
             "Exit Application",
             "Are you sure you want to exit?"
         )
         if response:
+            # Let a running write or list load finish before the connection closes
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            backend.db.close()
             self.root.destroy()
 
 
@@ -0,0 +1,237 @@
+"""
+Tests for the movie database backend
+Run with: python -m unittest
+"""
+
+import os
+import random
+import sqlite3
+import tempfile
+import unittest
+from unittest import mock
+
+# Importing the backend creates its default database in the working
+# directory, so do that inside a scratch directory
+_tmpdir = tempfile.TemporaryDirectory()
+_cwd = os.getcwd()
+os.chdir(_tmpdir.name)
+try:
+    import Backend_Project as backend
+finally:
+    os.chdir(_cwd)
+
+
+class DatabaseTestCase(unittest.TestCase):
+    """Gives each test its own database file"""
+    
+    def setUp(self):
+        self.path = os.path.join(_tmpdir.name, f"{self.id()}.db")
+        self.db = backend.MovieDatabase(self.path)
+    
+    def tearDown(self):
+        self.db.close()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(self.path + suffix):
+                os.remove(self.path + suffix)
+
+
+class StatisticsCacheTest(DatabaseTestCase):
+    """The running statistics counters must match a fresh recount"""
+    
+    def recount(self):
+        """Statistics computed from scratch by a separate connection"""
+        fresh = backend.MovieDatabase(self.path)
+        try:
+            return fresh.get_statistics()
+        finally:
+            fresh.close()
+    
+    def test_non_finite_ratings_are_ignored(self):
+        self.db.get_statistics()  # warm the cache
+        self.db.add_movie("m1", "A", rating="4")
+        self.db.add_movie("m2", "B", rating="nan")
+        self.db.add_movie("m3", "C", rating="inf")
+        self.assertEqual(self.db.get_statistics(), {'total_movies': 3, 'average_rating': 4.0})
+        self.assertEqual(self.db.get_statistics(), self.recount())
+    
+    def test_counters_match_recount_after_writes(self):
+        rng = random.Random(1234)
+        ratings = ["", "0", "1", "2.5", "4", "5", "x", "nan", "-inf"]
+        self.db.get_statistics()
+        
+        for i in range(200):
+            op = rng.random()
+            if op < 0.5:
+                self.db.add_movie(f"M{i}", "Movie", rating=rng.choice(ratings))
+            elif op < 0.8:
+                self.db.update_movie(rng.randint(1, i + 1), f"U{i}", "Movie",
+                                     rating=rng.choice(ratings))
+            else:
+                self.db.delete_movie(rng.randint(1, i + 1))
+            
+            if i % 20 == 0:
+                self.assertEqual(self.db.get_statistics(), self.recount())
+        
+        self.assertEqual(self.db.get_statistics(), self.recount())
+
+
+class StatisticsCacheWithoutReturningTest(StatisticsCacheTest):
+    """Same checks on the read-back path used for SQLite older than 3.35"""
+    
+    def setUp(self):
+        super().setUp()
+        self.db._HAS_RETURNING = False
+
+
+class WriteReturningTest(DatabaseTestCase):
+    """add/update_movie_returning hand back the record as stored"""
+    
+    def test_writes_return_the_stored_row(self):
+        success, _, row = self.db.add_movie_returning("m1", "A", rating="4")
+        self.assertTrue(success)
+        self.assertEqual(tuple(row), (1, "m1", "A", "", "", "", "", "", "4"))
+        
+        success, _, row = self.db.update_movie_returning(row[0], "m1", "B", rating="2")
+        self.assertTrue(success)
+        self.assertEqual(row["movie_name"], "B")
+        
+        self.assertEqual(self.db.add_movie_returning("m1", "dup"),
+                         (False, "Movie ID 'm1' already exists!", None))
+        self.assertEqual(self.db.add_movie("m2", "C"), (True, "Movie added successfully!"))
+
+
+class WriteReturningWithoutReturningTest(WriteReturningTest):
+    """Same checks on the read-back path used for SQLite older than 3.35"""
+    
+    def setUp(self):
+        super().setUp()
+        self.db._HAS_RETURNING = False
+
+
+class BulkImportTest(DatabaseTestCase):
+    """add_movies_bulk validation, chunking and duplicate counting"""
+    
+    def commits(self, rows):
+        """Run add_movies_bulk on rows; returns (result, COMMITs issued)"""
+        statements = []
+        self.db.con.set_trace_callback(statements.append)
+        try:
+            result = self.db.add_movies_bulk(rows)
+        finally:
+            self.db.con.set_trace_callback(None)
+        return result, statements.count("COMMIT")
+    
+    def test_commits_once_per_chunk(self):
+        rows = [(f"m{i}", f"Movie {i}") for i in range(5)]
+        with mock.patch.object(backend, "BULK_CHUNK_SIZE", 2):
+            self.assertEqual(self.commits(rows), ((5, 0), 3))
+        self.assertEqual(len(list(self.db.view_all_movies())), 5)
+    
+    def test_duplicates_and_invalid_rows_are_skipped(self):
+        self.db.add_movie("m1", "Existing")
+        rows = [
+            ("m1", "Duplicate of stored row"),
+            ("m2", "New", "", "", "", "", "", "4.5"),
+            ("m2", "Duplicate within import"),
+            ("m3", "Too high", "", "", "", "", "", "6"),
+            ("m4", "Not a number", "", "", "", "", "", "good"),
+            ("", "No ID"),
+            ("m5", ""),
+        ]
+        self.assertEqual(self.db.add_movies_bulk(rows), (1, 6))
+        self.assertEqual([row[1] for row in self.db.view_all_movies()], ["m2", "m1"])
+    
+    def test_short_and_long_rows_are_fitted_to_the_columns(self):
+        self.assertEqual(self.db.add_movies_bulk([
+            (" m1 ", " Short "),
+            ("m2", "Long", "2001", "Dir", "Cast", "1M", "90", "3", "extra", "more"),
+        ]), (2, 0))
+        rows = {row[1]: tuple(row)[2:] for row in self.db.view_all_movies()}
+        self.assertEqual(rows["m1"], ("Short", "", "", "", "", "", ""))
+        self.assertEqual(rows["m2"], ("Long", "2001", "Dir", "Cast", "1M", "90", "3"))
+    
+    def test_statistics_are_recounted_after_import(self):
+        self.db.add_movie("m1", "A", rating="2")
+        self.db.get_statistics()  # warm the cache
+        self.db.add_movies_bulk([("m1", "dup", "", "", "", "", "", "5"),
+                                 ("m2", "B", "", "", "", "", "", "4")])
+        self.assertEqual(self.db.get_statistics(), {'total_movies': 2, 'average_rating': 3.0})
+
+
+class MigrationTest(DatabaseTestCase):
+    """Opening a database created before rating_num and movies_fts existed"""
+    
+    def setUp(self):
+        self.path = os.path.join(_tmpdir.name, f"{self.id()}.db")
+        con = sqlite3.connect(self.path)
+        with con:
+            con.execute("""
+                CREATE TABLE movies (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    movie_id TEXT NOT NULL UNIQUE,
+                    movie_name TEXT NOT NULL,
+                    release_date TEXT,
+                    director TEXT,
+                    "cast" TEXT,
+                    budget TEXT,
+                    duration TEXT,
+                    rating TEXT
+                )
+            """)
+            con.executemany(
+                "INSERT INTO movies (movie_id, movie_name, director, rating) VALUES (?, ?, ?, ?)",
+                [("M01", "Inception", "Christopher Nolan", "4"),
+                 ("M02", "Spider-Man", "Sam Raimi", "unrated")])
+        con.close()
+        super().setUp()
+    
+    def test_rating_num_is_backfilled(self):
+        ratings = self.db.con.execute("SELECT movie_id, rating_num FROM movies ORDER BY id")
+        self.assertEqual([tuple(row) for row in ratings], [("M01", 4.0), ("M02", None)])
+        self.assertEqual(self.db.get_statistics(), {'total_movies': 2, 'average_rating': 4.0})
+    
+    def test_existing_rows_are_full_text_indexed(self):
+        self.assertEqual([row[2] for row in self.db.search_movies(director="raimi")],
+                         ["Spider-Man"])
+
+
+class SearchTest(DatabaseTestCase):
+    """search_movies field handling and matching"""
+    
+    def setUp(self):
+        super().setUp()
+        self.db.add_movie("M01", "Inception", "2010", "Christopher Nolan", "Leo", "", "", "4")
+        self.db.add_movie("M02", "Spider-Man", "2002", "Sam Raimi", "Tobey", "", "", "3")
+    
+    def names(self, rows):
+        return sorted(row[2] for row in rows)
+    
+    def test_words_mode_matches_word_prefixes(self):
+        self.assertEqual(self.names(self.db.search_movies(movie_name="incep")), ["Inception"])
+        self.assertEqual(self.names(self.db.search_movies(director="nol")), ["Inception"])
+        self.assertEqual(self.db.search_movies(movie_name="ception"), [])
+        # Non-FTS fields keep substring matching
+        self.assertEqual(self.names(self.db.search_movies(release_date="01")), ["Inception"])
+    
+    def test_blank_full_text_value_is_ignored(self):
+        # Must not turn into an empty FTS query that fails the whole search
+        self.assertEqual(self.names(self.db.search_movies(movie_name="   ", rating="3")),
+                         ["Spider-Man"])
+        self.assertEqual(len(self.db.search_movies(director="  ")), 2)
+    
+    def test_like_wildcards_match_literally(self):
+        self.db.add_movie("M03", "100% Wolf", "2020", "A_Director")
+        self.assertEqual(self.db.search_movies(mode="prefix", movie_name="%"), [])
+        self.assertEqual(self.names(self.db.search_movies(mode="prefix", movie_name="100%")),
+                         ["100% Wolf"])
+        self.assertEqual(self.names(self.db.search_movies(mode="prefix", director="a_")),
+                         ["100% Wolf"])
+        self.assertEqual(self.db.search_movies(release_date="_"), [])
+    
+    def test_unknown_field_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self.db.search_movies(foo="o")
+
+
+if __name__ == '__main__':
+    unittest.main()